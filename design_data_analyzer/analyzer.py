@@ -2,21 +2,37 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 from .extraction import extract_from_path
 from .pipeline import AggregatedEvidence, ImageExtraction, consolidate
 
 
-def analyze_paths(paths: Iterable[Path]) -> List[ImageExtraction]:
-    """Run extraction across multiple image paths."""
+def analyze_paths(
+    paths: Iterable[Path],
+    *,
+    cache_dir: Optional[Path] = None,
+) -> List[ImageExtraction]:
+    """Run extraction across multiple image paths.
 
-    extractions: List[ImageExtraction] = []
-    for path in paths:
-        extraction = extract_from_path(path)
-        extractions.append(extraction)
-    return extractions
+    Image decode, blur, and OCR all release the GIL, so multi-image batches
+    run across a thread pool; results keep the input order. Single images
+    skip the pool to avoid its setup cost. ``cache_dir`` is passed through to
+    the persistent per-file extraction cache.
+    """
+
+    extract = partial(extract_from_path, cache_dir=cache_dir)
+    path_list = list(paths)
+    if len(path_list) <= 1:
+        return [extract(path) for path in path_list]
+
+    workers = min(len(path_list), os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(extract, path_list))
 
 
 def aggregate(extractions: Iterable[ImageExtraction]) -> AggregatedEvidence:
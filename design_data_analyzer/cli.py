@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import io
 import json
+import sys
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Optional, Sequence, TextIO
 
-from .analyzer import aggregate as aggregate_local, analyze_paths
-from .guidelines import build_document, build_document_from_spec, render_markdown
-from .io_utils import collect_image_paths, load_env_file
-from .pipeline import aggregated_to_dict
+try:  # pragma: no cover - optional speedup
+    import orjson
+except ImportError:
+    orjson = None
+
+from .io_utils import collect_image_paths, hash_file_contents, load_env_file
 
 
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
@@ -69,11 +74,54 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         default=1024,
         help="Maximum tokens for OpenAI responses (default: 1024).",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit images through the OpenAI Batch API (slower, ~50% cheaper).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of concurrent OpenAI requests (default: 8).",
+    )
+    parser.add_argument(
+        "--images-per-request",
+        type=int,
+        default=1,
+        help="Pack this many images into each OpenAI request to amortize prompt overhead (default: 1).",
+    )
+    parser.add_argument(
+        "--no-aggregate",
+        action="store_true",
+        help="With --format json, emit per-image results only and skip cross-image aggregation.",
+    )
     parser.add_argument(
         "--fail-fast",
         action="store_true",
         help="Abort OpenAI analysis if any image fails to process.",
     )
+    parser.add_argument(
+        "--max-edge",
+        type=int,
+        default=1024,
+        help="Downscale images so the longest edge fits this size before upload; 0 disables (default: 1024).",
+    )
+    parser.add_argument(
+        "--detail",
+        choices=["low", "auto", "high"],
+        default="low",
+        help="Vision detail level; low keeps token cost minimal for guideline cues (default: low).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for cached OpenAI responses (default: ~/.cache/design_data_analyzer/responses).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk response cache.",
+    )
     parser.add_argument(
         "--env-file",
         default=".env",
@@ -82,6 +130,48 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def _dumps_indented(payload: dict) -> str:
+    """Serialize a payload to pretty-printed JSON, preferring orjson."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(payload, indent=2, ensure_ascii=False)
+
+
+def _dumps_compact(payload: object) -> str:
+    """Serialize a payload to compact JSON, preferring orjson."""
+
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+def _stream_openai_json(
+    out: TextIO,
+    brand_name: str,
+    per_image: list[dict[str, object]],
+    compiled: Optional[dict] = None,
+) -> None:
+    """Write the OpenAI JSON payload incrementally, one per-image record at a time.
+
+    Per-image records dominate the output size; framing the envelope by hand
+    keeps peak memory at one serialized record instead of the whole document.
+    """
+
+    out.write(
+        f'{{"brand_name": {_dumps_compact(brand_name)}, "engine": "openai", '
+        f'"design_spec": {{"images_analyzed": {len(per_image)}, "per_image": ['
+    )
+    for index, record in enumerate(per_image):
+        out.write("\n" if index == 0 else ",\n")
+        out.write(_dumps_compact(record))
+    out.write("\n]")
+    if compiled is not None:
+        out.write(', "compiled": ')
+        out.write(_dumps_compact(compiled))
+    out.write("}}")
+
+
 def _collect_paths(args: argparse.Namespace) -> list[Path]:
     return collect_image_paths(
         inputs=args.images,
@@ -90,40 +180,113 @@ def _collect_paths(args: argparse.Namespace) -> list[Path]:
     )
 
 
-def _run_local(paths: list[Path], args: argparse.Namespace) -> str:
-    extractions = analyze_paths(paths)
+def _extraction_cache_dir(args: argparse.Namespace) -> Optional[Path]:
+    if args.no_cache:
+        return None
+    from .extraction import DEFAULT_CACHE_DIR
+
+    return DEFAULT_CACHE_DIR
+
+
+def _run_local(paths: list[Path], args: argparse.Namespace, out: TextIO) -> None:
+    # Imported lazily so OpenAI-only and --help invocations skip numpy/PIL.
+    from .analyzer import aggregate as aggregate_local, analyze_paths
+
+    extractions = analyze_paths(paths, cache_dir=_extraction_cache_dir(args))
     evidence = aggregate_local(extractions)
 
     if args.format == "json":
+        from .pipeline import aggregated_to_dict
+
         payload = {
             "brand_name": args.brand_name,
             "engine": "local",
             "evidence": aggregated_to_dict(evidence),
         }
-        return json.dumps(payload, indent=2, ensure_ascii=False)
+        out.write(_dumps_indented(payload))
+        return
+
+    # Markdown rendering is only needed on this branch.
+    from .guidelines import build_document, write_markdown
 
     document = build_document(evidence, brand_name=args.brand_name)
-    return render_markdown(document)
+    write_markdown(document, out)
+
+
+def _dedupe_by_content(paths: list[Path]) -> tuple[list[Path], dict[Path, Path]]:
+    """Map byte-identical files to one representative so each is analyzed once.
+
+    Returns the unique paths to dispatch plus a mapping from every input path
+    to the representative whose analysis result it shares.
+    """
 
+    unique_paths: list[Path] = []
+    representative: dict[Path, Path] = {}
+    first_by_digest: dict[str, Path] = {}
 
-def _run_openai(paths: list[Path], args: argparse.Namespace) -> str:
+    for path in paths:
+        digest = hash_file_contents(path)
+        if digest is None:
+            representative[path] = path
+            unique_paths.append(path)
+            continue
+        first = first_by_digest.get(digest)
+        if first is None:
+            first_by_digest[digest] = path
+            representative[path] = path
+            unique_paths.append(path)
+        else:
+            representative[path] = first
+            print(f"Reusing analysis of {first} for identical image {path}")
+
+    return unique_paths, representative
+
+
+def _run_openai(paths: list[Path], args: argparse.Namespace, out: TextIO) -> None:
     if args.env_file:
         load_env_file(Path(args.env_file).expanduser())
 
     from . import openai_integration as openai_api  # Imported lazily to avoid mandatory dependency.
 
-    client = openai_api.build_client(args.api_key)
+    cache_dir: Optional[Path] = None
+    if not args.no_cache:
+        cache_dir = Path(args.cache_dir).expanduser() if args.cache_dir else openai_api.DEFAULT_CACHE_DIR
 
-    per_image: list[dict[str, object]] = []
-    for path in paths:
-        print(f"Analyzing {path} with OpenAI...")
-        guidelines = openai_api.analyze_image(
-            client=client,
-            image_path=path,
+    unique_paths, representative = _dedupe_by_content(paths)
+
+    if args.batch:
+        client = openai_api.build_client(args.api_key, concurrency=args.concurrency)
+        unique_results = openai_api.analyze_images_batch(
+            client,
+            unique_paths,
             model=args.model,
             temperature=args.temperature,
             max_output_tokens=args.max_output_tokens,
+            max_edge=args.max_edge,
+            detail=args.detail,
+        )
+    else:
+        async_client = openai_api.build_async_client(args.api_key, concurrency=args.concurrency)
+        unique_results = asyncio.run(
+            openai_api.analyze_images(
+                async_client,
+                unique_paths,
+                model=args.model,
+                temperature=args.temperature,
+                max_output_tokens=args.max_output_tokens,
+                concurrency=args.concurrency,
+                cache_dir=cache_dir,
+                max_edge=args.max_edge,
+                images_per_request=args.images_per_request,
+                detail=args.detail,
+            )
         )
+
+    result_by_path = dict(zip(unique_paths, unique_results))
+
+    per_image: list[dict[str, object]] = []
+    for path in paths:
+        guidelines = result_by_path[representative[path]]
         if guidelines:
             per_image.append({"image": str(path), "guidelines": guidelines})
         elif args.fail_fast:
@@ -132,46 +295,69 @@ def _run_openai(paths: list[Path], args: argparse.Namespace) -> str:
     if not per_image:
         raise SystemExit("No analyses succeeded; check API credentials and retry.")
 
+    if args.format == "json" and args.no_aggregate:
+        # Aggregation is pure overhead when the caller only wants raw
+        # per-image results; skip the set merging and finalization entirely.
+        _stream_openai_json(out, args.brand_name, per_image)
+        return
+
     design_spec = openai_api.aggregate_guidelines(per_image)
 
     if args.format == "json":
-        payload = {
-            "brand_name": args.brand_name,
-            "engine": "openai",
-            "design_spec": design_spec,
-        }
-        return json.dumps(payload, indent=2, ensure_ascii=False)
+        _stream_openai_json(
+            out,
+            args.brand_name,
+            per_image,
+            compiled=design_spec["compiled"],
+        )
+        return
 
-    # Supplement OpenAI data with local heuristics for layout cues.
-    local_evidence = aggregate_local(analyze_paths(paths))
+    # Supplement OpenAI data with local heuristics for layout cues. Imported
+    # here so JSON-only OpenAI runs never load numpy/PIL or the renderer.
+    from .analyzer import aggregate as aggregate_local, analyze_paths
+    from .guidelines import build_document_from_spec, write_markdown
+
+    local_evidence = aggregate_local(
+        analyze_paths(paths, cache_dir=_extraction_cache_dir(args))
+    )
     document = build_document_from_spec(
         design_spec,
         brand_name=args.brand_name,
         evidence=local_evidence,
     )
-    return render_markdown(document)
+    write_markdown(document, out)
 
 
-def run_analysis(args: argparse.Namespace) -> str:
+def _run_to_stream(args: argparse.Namespace, out: TextIO) -> None:
     paths = _collect_paths(args)
     if not paths:
         raise SystemExit("No valid images were found to analyze.")
 
     if args.engine == "local":
-        return _run_local(paths, args)
-    return _run_openai(paths, args)
+        _run_local(paths, args, out)
+    else:
+        _run_openai(paths, args, out)
+
+
+def run_analysis(args: argparse.Namespace) -> str:
+    """Run the configured analysis and return the rendered output as a string."""
+
+    buffer = io.StringIO()
+    _run_to_stream(args, buffer)
+    return buffer.getvalue()
 
 
 def main(argv: Optional[Sequence[str]] = None) -> None:
     args = parse_args(argv)
-    output = run_analysis(args)
 
     if args.output:
         destination = Path(args.output).expanduser()
-        destination.write_text(output, encoding="utf-8")
+        with open(destination, "w", encoding="utf-8", buffering=1 << 20) as out:
+            _run_to_stream(args, out)
         print(f"Guidelines written to {destination}")
     else:
-        print(output)
+        _run_to_stream(args, sys.stdout)
+        print()
 
 
 __all__ = ["parse_args", "run_analysis", "main"]
@@ -2,26 +2,47 @@
 
 from __future__ import annotations
 
+import os
+import pickle
+import sys
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from PIL import Image
 
 from ..pipeline import ImageExtraction
 from .colors import extract_colors
+from .decode import DecodedImage, decode_image
 from .layout import summarize_layout
 from .text import build_typography_samples, extract_text_lines
 
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "design_data_analyzer" / "extractions"
 
-def extract_from_path(path: Path) -> ImageExtraction:
-    """Collect structured signals from a single image asset."""
+
+def extract_from_path(path: Path, *, cache_dir: Optional[Path] = None) -> ImageExtraction:
+    """Collect structured signals from a single image asset.
+
+    With ``cache_dir`` set, results are persisted keyed by the file's path,
+    mtime, and size, so unchanged assets skip decode, color, layout, and OCR
+    work entirely on later runs.
+    """
+
+    key = _cache_key(path) if cache_dir else None
+    if cache_dir and key:
+        cached = _cache_load(cache_dir, key)
+        if cached is not None:
+            return cached
 
     with Image.open(path) as img:
         img.load()
-        colors = extract_colors(img)
-        layout = summarize_layout(img)
-        text_lines = extract_text_lines(img)
-        typography = build_typography_samples(text_lines)
+        # Convert to the shared RGBA/grayscale buffers once; each extractor
+        # used to redo its own convert() over the full pixel data.
+        decoded = decode_image(img)
+
+    colors = extract_colors(decoded)
+    layout = summarize_layout(decoded)
+    text_lines = extract_text_lines(decoded, source=path)
+    typography = build_typography_samples(text_lines)
 
     notes: List[str] = []
     if not colors:
@@ -31,7 +52,7 @@ def extract_from_path(path: Path) -> ImageExtraction:
     if not text_lines:
         notes.append("No copy detected automatically; review manually for critical messaging.")
 
-    return ImageExtraction(
+    extraction = ImageExtraction(
         source=path,
         colors=colors,
         typography=typography,
@@ -39,6 +60,44 @@ def extract_from_path(path: Path) -> ImageExtraction:
         detected_copy=text_lines,
         notes=notes,
     )
+    if cache_dir and key:
+        _cache_store(cache_dir, key, extraction)
+    return extraction
+
+
+def _cache_key(path: Path) -> Optional[str]:
+    """Fingerprint a file by identity and freshness without reading its bytes."""
+
+    import hashlib
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    raw = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cache_load(cache_dir: Path, key: str) -> Optional[ImageExtraction]:
+    try:
+        payload = (cache_dir / f"{key}.pkl").read_bytes()
+    except OSError:
+        return None
+    try:
+        cached = pickle.loads(payload)
+    except Exception:  # noqa: S110 - any stale/corrupt entry just means a re-run
+        return None
+    return cached if isinstance(cached, ImageExtraction) else None
+
+
+def _cache_store(cache_dir: Path, key: str, extraction: ImageExtraction) -> None:
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_dir / f"{key}.pkl.tmp"
+        tmp_file.write_bytes(pickle.dumps(extraction))
+        os.replace(tmp_file, cache_dir / f"{key}.pkl")
+    except OSError as exc:
+        print(f"Failed to cache extraction: {exc}", file=sys.stderr)
 
 
-__all__ = ["extract_from_path"]
+__all__ = ["extract_from_path", "DEFAULT_CACHE_DIR"]
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-from collections import Counter
-from math import sqrt
-from typing import Iterable, List, Tuple
+from typing import List, Tuple
 
-from PIL import Image
+import numpy as np
 
 from ..pipeline import ColorSwatch
+from .decode import DecodedImage
 
 # Simple named color anchors for labelling without extra dependencies.
 NAMED_COLORS: List[Tuple[str, Tuple[int, int, int]]] = [
@@ -32,35 +31,80 @@ NAMED_COLORS: List[Tuple[str, Tuple[int, int, int]]] = [
 ]
 
 
-def extract_colors(image: Image.Image, max_colors: int = 5) -> List[ColorSwatch]:
+# Cap on pixels fed into color counting; prominence estimates stabilize well
+# below this, so larger inputs only add memory traffic.
+_SAMPLE_BUDGET = 50_000
+
+
+def extract_colors(decoded: DecodedImage, max_colors: int = 5) -> List[ColorSwatch]:
     """Return the most prominent colors in the image."""
 
-    working = image.convert("RGBA")
-    # Resize to limit the number of pixels processed.
-    working.thumbnail((600, 600))
-    # Flatten alpha by compositing over white to avoid transparent noise.
-    background = Image.new("RGBA", working.size, (255, 255, 255, 255))
-    flattened = Image.alpha_composite(background, working)
-    rgb_image = flattened.convert("RGB")
+    # Resize to limit the number of pixels processed; resize (not thumbnail)
+    # keeps the shared RGBA buffer untouched for the other extractors.
+    working = decoded.rgba
+    width, height = working.size
+    if width > 600 or height > 600:
+        scale = min(600 / width, 600 / height)
+        working = working.resize((max(1, int(width * scale)), max(1, int(height * scale))))
 
-    palette = rgb_image.convert("P", palette=Image.ADAPTIVE, colors=max_colors)
-    palette_colors = palette.getpalette()[: max_colors * 3]
-    counts = Counter(palette.getdata())
+    # Flatten alpha by compositing over white to avoid transparent noise.
+    # Done directly in NumPy: the PIL background + alpha_composite + convert
+    # sequence traversed the image three times through two extra buffers.
+    rgba = np.asarray(working, dtype=np.uint8)
+    alpha = rgba[..., 3]
+    if int(alpha.min()) == 255:
+        arr = rgba[..., :3].reshape(-1, 3)
+    else:
+        scale = alpha[..., np.newaxis].astype(np.float32) / 255.0
+        blended = rgba[..., :3].astype(np.float32) * scale + 255.0 * (1.0 - scale)
+        arr = (blended + 0.5).astype(np.uint8)
+        arr = arr.reshape(-1, 3)
+
+    # Quantize to 4 bits per channel and count occupancy of the 4096 bins in
+    # one C-level pass; the adaptive-palette + Counter approach walked every
+    # pixel as a Python object.
+    if arr.shape[0] > _SAMPLE_BUDGET:
+        # A fixed sample keeps the counting cost flat regardless of input
+        # size; a seeded generator keeps repeat runs deterministic.
+        indices = np.random.default_rng(0).integers(0, arr.shape[0], _SAMPLE_BUDGET)
+        arr = arr[indices]
+    quantized = arr >> 4
+    keys = (
+        (quantized[:, 0].astype(np.uint32) << 8)
+        | (quantized[:, 1].astype(np.uint32) << 4)
+        | quantized[:, 2]
+    )
+    counts = np.bincount(keys, minlength=4096)
+
+    top_bins = np.argpartition(counts, -max_colors)[-max_colors:]
+    top_bins = top_bins[np.argsort(counts[top_bins])[::-1]]
+
+    # Mean color per bin rather than the bin midpoint, so swatches keep the
+    # fidelity the adaptive palette used to provide.
+    sum_r = np.bincount(keys, weights=arr[:, 0], minlength=4096)
+    sum_g = np.bincount(keys, weights=arr[:, 1], minlength=4096)
+    sum_b = np.bincount(keys, weights=arr[:, 2], minlength=4096)
+
+    total_pixels = arr.shape[0] or 1
+
+    top_bins = top_bins[counts[top_bins] > 0]
+    if top_bins.size == 0:
+        return []
+
+    bin_counts = counts[top_bins].astype(np.float64)
+    centroids = (
+        (np.stack((sum_r[top_bins], sum_g[top_bins], sum_b[top_bins]), axis=1) / bin_counts[:, None])
+        + 0.5
+    ).astype(np.int16)
+    names = _closest_named_colors(centroids)
 
     swatches: List[ColorSwatch] = []
-    total_pixels = sum(counts.values()) or 1
-
-    for index, count in counts.most_common(max_colors):
-        base_index = index * 3
-        if base_index + 2 >= len(palette_colors):
-            continue
-        r, g, b = palette_colors[base_index : base_index + 3]
+    for (r, g, b), name, count in zip(centroids.tolist(), names, bin_counts.tolist()):
         prominence = count / total_pixels
-        hex_code = f"#{r:02X}{g:02X}{b:02X}"
         swatches.append(
             ColorSwatch(
-                hex=hex_code,
-                name=_closest_named_color((r, g, b)),
+                hex=f"#{r:02X}{g:02X}{b:02X}",
+                name=name,
                 prominence=prominence,
                 usage_hint=_usage_hint(prominence),
             )
@@ -69,14 +113,27 @@ def extract_colors(image: Image.Image, max_colors: int = 5) -> List[ColorSwatch]
     return swatches
 
 
+# Anchor table laid out once for vectorized nearest-neighbor lookup.
+_ANCHOR_NAMES = [name for name, _ in NAMED_COLORS]
+_ANCHOR_RGB = np.array([rgb for _, rgb in NAMED_COLORS], dtype=np.int16)
+
+
 def _closest_named_color(rgb: Tuple[int, int, int]) -> str:
     """Pick the nearest predefined color name for labelling."""
 
-    def distance(candidate: Tuple[int, int, int]) -> float:
-        return sqrt(sum((component - ref) ** 2 for component, ref in zip(candidate, rgb)))
+    return _closest_named_colors(np.asarray([rgb], dtype=np.int16))[0]
+
+
+def _closest_named_colors(centroids: np.ndarray) -> List[str]:
+    """Label a (K, 3) batch of colors against the anchors in one broadcast.
+
+    int32 keeps the squared sums (up to 3 * 255**2) out of overflow range,
+    and squared distance preserves the ordering so the sqrt is unnecessary.
+    """
 
-    name, _ = min(NAMED_COLORS, key=lambda item: distance(item[1]))
-    return name
+    deltas = (centroids[:, None, :] - _ANCHOR_RGB[None, :, :]).astype(np.int32)
+    best = np.einsum("kij,kij->ki", deltas, deltas).argmin(axis=1)
+    return [_ANCHOR_NAMES[index] for index in best]
 
 
 def _usage_hint(prominence: float) -> str:
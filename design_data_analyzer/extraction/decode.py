@@ -0,0 +1,30 @@
+"""Shared image decoding for the extraction pipeline."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Tuple
+
+from PIL import Image
+
+
+@dataclass(frozen=True)
+class DecodedImage:
+    """One decoded asset plus the mode conversions every extractor needs.
+
+    Converting once here means the color, layout, and text passes share the
+    RGBA and grayscale buffers instead of each producing its own copy.
+    """
+
+    rgba: Image.Image
+    gray: Image.Image
+    size: Tuple[int, int]
+
+
+def decode_image(image: Image.Image) -> DecodedImage:
+    """Materialize the canonical conversions for a decoded PIL image."""
+
+    return DecodedImage(rgba=image.convert("RGBA"), gray=image.convert("L"), size=image.size)
+
+
+__all__ = ["DecodedImage", "decode_image"]
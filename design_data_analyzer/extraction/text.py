@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from typing import List
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from PIL import Image
 
 try:  # pragma: no cover - optional dependency
@@ -12,55 +16,122 @@ except Exception:  # noqa: S110 - broad exception acceptable for optional featur
     pytesseract = None
 
 from ..pipeline import TypographySample
+from .decode import DecodedImage
 
 
-def extract_text_lines(image: Image.Image, *, min_length: int = 3) -> List[str]:
-    """Attempt to OCR text from the image, falling back to empty list."""
+# Raw OCR output keyed by (path, mtime_ns, size); tesseract dominates the
+# text pipeline, so repeat analyses of unchanged assets skip it entirely.
+_OCR_CACHE: Dict[Tuple[str, int, int], str] = {}
+
+
+def extract_text_lines(
+    decoded: DecodedImage,
+    *,
+    min_length: int = 3,
+    source: Optional[Path] = None,
+) -> List[str]:
+    """Attempt to OCR text from the image, falling back to empty list.
+
+    When ``source`` is given, the raw OCR output is memoized against the
+    file's mtime and size so unchanged assets are never re-OCRed in-process.
+    """
 
     if pytesseract is None:
         return []
 
-    # pytesseract expects RGB images.
-    rgb = image.convert("RGB")
-    text = pytesseract.image_to_string(rgb)
+    key: Optional[Tuple[str, int, int]] = None
+    if source is not None:
+        try:
+            stat = os.stat(source)
+            key = (os.fspath(source), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            key = None
+
+    text = _OCR_CACHE.get(key) if key is not None else None
+    if text is None:
+        # Tesseract runtime scales with pixel count and performs best on
+        # binarized input, so preprocess before handing the image over.
+        prepared = _prepare_for_ocr(decoded.gray)
+        text = pytesseract.image_to_string(prepared, config="--psm 6")
+        if key is not None:
+            _OCR_CACHE[key] = text
+
     lines = [clean.strip() for clean in text.splitlines()]
     return [line for line in lines if len(line) >= min_length]
 
 
+def _prepare_for_ocr(gray: Image.Image) -> Image.Image:
+    """Downscale tall images and Otsu-binarize to cut tesseract's workload."""
+
+    width, height = gray.size
+    if height > 1000:
+        scale = 1000 / height
+        gray = gray.resize((max(1, round(width * scale)), 1000), Image.Resampling.LANCZOS)
+
+    arr = np.asarray(gray)
+    threshold = _otsu_threshold(arr)
+    return Image.fromarray(np.where(arr > threshold, 255, 0).astype(np.uint8), mode="L")
+
+
+def _otsu_threshold(arr: np.ndarray) -> int:
+    """Pick the gray level maximizing between-class variance."""
+
+    histogram = np.bincount(arr.ravel(), minlength=256).astype(np.float64)
+    cumulative = np.cumsum(histogram)
+    cumulative_mean = np.cumsum(histogram * np.arange(256))
+
+    weight_low = cumulative[:-1]
+    weight_high = cumulative[-1] - weight_low
+    valid = (weight_low > 0) & (weight_high > 0)
+    if not valid.any():
+        return 127
+
+    mean_low = np.divide(cumulative_mean[:-1], weight_low, out=np.zeros(255), where=valid)
+    mean_high = np.divide(
+        cumulative_mean[-1] - cumulative_mean[:-1], weight_high, out=np.zeros(255), where=valid
+    )
+    variance = weight_low * weight_high * (mean_low - mean_high) ** 2
+    variance[~valid] = 0.0
+    return int(np.argmax(variance))
+
+
 def build_typography_samples(lines: List[str]) -> List[TypographySample]:
     """Generate lightweight typography descriptors based on OCR output."""
 
-    samples: List[TypographySample] = []
-    seen: set[str] = set()
+    # dict.fromkeys dedupes case-insensitively in one pass while keeping the
+    # first-seen spelling and order; the old loop lowercased each line twice.
+    unique: Dict[str, str] = {}
     for line in lines:
         normalized = " ".join(line.split())
-        if not normalized or normalized.lower() in seen:
-            continue
-        seen.add(normalized.lower())
-        samples.append(
-            TypographySample(
-                text=normalized,
-                casing=_infer_casing(normalized),
-                weight=_infer_weight(normalized),
-                classification=_infer_classification(normalized),
-            )
+        if normalized:
+            unique.setdefault(normalized.lower(), normalized)
+
+    return [
+        TypographySample(
+            text=normalized,
+            casing=_infer_casing(normalized),
+            weight=_infer_weight(normalized),
+            classification=_infer_classification(normalized),
         )
-    return samples
+        for normalized in unique.values()
+    ]
 
 
+@lru_cache(maxsize=2048)
 def _infer_casing(text: str) -> str:
-    letters = [c for c in text if c.isalpha()]
-    if not letters:
-        return "mixed"
-    if all(c.isupper() for c in letters):
+    # str.isupper/islower scan in C and already require at least one cased
+    # character, replacing the temporary letters list and two all() passes.
+    if text.isupper():
         return "uppercase"
-    if all(c.islower() for c in letters):
+    if text.islower():
         return "lowercase"
-    if letters[0].isupper():
+    first_letter = next((char for char in text if char.isalpha()), None)
+    if first_letter is not None and first_letter.isupper():
         return "title"
     return "mixed"
 
 
+@lru_cache(maxsize=2048)
 def _infer_weight(text: str) -> str:
     if len(text) <= 12 and text.isupper():
         return "bold"
@@ -69,6 +140,7 @@ def _infer_weight(text: str) -> str:
     return "medium"
 
 
+@lru_cache(maxsize=2048)
 def _infer_classification(text: str) -> str:
     words = text.split()
     if len(words) <= 4 and text.isupper():
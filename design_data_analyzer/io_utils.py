@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import base64
+import binascii
 import mimetypes
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence
 
-SUPPORTED_IMAGE_EXTENSIONS = {
+SUPPORTED_IMAGE_EXTENSIONS = frozenset({
     ".png",
     ".jpg",
     ".jpeg",
@@ -18,7 +19,7 @@ SUPPORTED_IMAGE_EXTENSIONS = {
     ".bmp",
     ".tif",
     ".tiff",
-}
+})
 
 
 def collect_image_paths(
@@ -29,29 +30,54 @@ def collect_image_paths(
 ) -> List[Path]:
     """Gather unique image paths from direct inputs and optional directories."""
 
-    supported = {ext.lower() for ext in supported_exts}
+    # The default extension set is already lowercase; only normalize when a
+    # caller supplies a custom iterable.
+    supported = (
+        SUPPORTED_IMAGE_EXTENSIONS
+        if supported_exts is SUPPORTED_IMAGE_EXTENSIONS
+        else frozenset(ext.lower() for ext in supported_exts)
+    )
     ordered_paths: List[Path] = []
-    seen: set[Path] = set()
+    seen: set[str] = set()
 
-    def add_path(path: Path) -> None:
-        resolved = path.resolve()
-        if resolved in seen:
+    def add_file(path_str: str) -> None:
+        # Dedupe on normalized absolute strings; Path.resolve() would add
+        # readlink/stat syscalls per file for no benefit on large trees.
+        normalized = os.path.normpath(os.path.abspath(path_str))
+        if normalized in seen:
             return
-        if not resolved.is_file():
+        seen.add(normalized)
+        ordered_paths.append(Path(normalized))
+
+    def add_path(path: Path) -> None:
+        if not path.is_file():
             return
-        if resolved.suffix.lower() not in supported:
+        if path.suffix.lower() not in supported:
             return
-        seen.add(resolved)
-        ordered_paths.append(resolved)
+        add_file(str(path))
 
     def walk_directory(directory: Path) -> None:
         if not directory.exists():
             print(f"Skipping missing directory: {directory}", file=sys.stderr)
             return
-        pattern = "**/*" if recursive else "*"
-        for candidate in directory.glob(pattern):
-            if candidate.is_file() and candidate.suffix.lower() in supported:
-                add_path(candidate)
+        stack = [str(directory)]
+        while stack:
+            current = stack.pop()
+            try:
+                entries = os.scandir(current)
+            except OSError as exc:
+                print(f"Skipping unreadable directory {current}: {exc}", file=sys.stderr)
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        name = entry.name
+                        dot = name.rfind(".")
+                        if dot >= 0 and name[dot:].lower() in supported:
+                            add_file(entry.path)
 
     for raw in inputs:
         path = Path(raw).expanduser()
@@ -66,47 +92,173 @@ def collect_image_paths(
     return ordered_paths
 
 
+def hash_file_contents(path: Path) -> Optional[str]:
+    """Hash a file's contents for dedupe, returning None when it cannot be read.
+
+    BLAKE2b with a 16-byte digest is markedly faster than SHA-256 for this
+    non-cryptographic use while keeping collisions out of practical reach.
+    """
+
+    import hashlib
+
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(chunk)
+    except OSError as exc:
+        print(f"Failed to hash {path}: {exc}", file=sys.stderr)
+        return None
+    return digest.hexdigest()
+
+
+# Static table covering every extension we accept; mimetypes.guess_type
+# re-parses the whole path and consults a mutable registry on each call.
+_MIME_BY_EXT = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".bmp": "image/bmp",
+    ".tif": "image/tiff",
+    ".tiff": "image/tiff",
+}
+
+
 def guess_mime_type(path: Path) -> str:
     """Best-effort mime-type detection for image files."""
 
-    mime_type, _ = mimetypes.guess_type(str(path))
+    return _mime_for_suffix(path.suffix.lower())
+
+
+@lru_cache(maxsize=64)
+def _mime_for_suffix(suffix: str) -> str:
+    # Memoized on the suffix so the mimetypes database walk happens at most
+    # once per extension seen, not once per file.
+    mime_type = _MIME_BY_EXT.get(suffix)
+    if mime_type is None:
+        mime_type, _ = mimetypes.guess_type(f"f{suffix}")
     return mime_type or "image/png"
 
 
+def downscale_image_bytes(data: bytes, max_edge: int, mime_type: str) -> tuple[bytes, str]:
+    """Resize an image so its longest edge fits max_edge, re-encoding if needed.
+
+    High-resolution exports balloon upload size and vision-token cost without
+    adding signal the model can use. Images already within bounds are returned
+    untouched. Opaque images are re-encoded as JPEG; images with alpha keep PNG.
+    """
+
+    import io
+
+    from PIL import Image
+
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            if max(img.size) <= max_edge:
+                return data, mime_type
+            img.load()
+            resized = img.copy()
+            resized.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            if resized.mode in ("RGBA", "LA", "P"):
+                resized.save(buffer, format="PNG")
+                return buffer.getvalue(), "image/png"
+            resized.convert("RGB").save(buffer, format="JPEG", quality=90)
+            return buffer.getvalue(), "image/jpeg"
+    except OSError as exc:
+        print(f"Failed to downscale image, sending original: {exc}", file=sys.stderr)
+        return data, mime_type
+
+
+try:  # pragma: no cover - optional speedup
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    def _b64encode(data: bytes) -> bytes:
+        return binascii.b2a_base64(data, newline=False)
+
+
 def encode_image_as_data_url(data: bytes, mime_type: str) -> str:
-    """Encode raw image data as a data URL expected by the Responses API."""
+    """Encode raw image data as a data URL expected by the Responses API.
+
+    Builds the URL in a single growable buffer instead of materializing the
+    base64 payload, its str decode, and the final f-string separately — for
+    multi-megabyte images that would mean three extra full-size copies. When
+    pybase64 is installed its SIMD encoder replaces the scalar stdlib one.
+    """
+
+    buf = bytearray(f"data:{mime_type};base64,".encode("ascii"))
+    buf += _b64encode(data)
+    return buf.decode("ascii")
 
-    encoded = base64.b64encode(data).decode("ascii")
-    return f"data:{mime_type};base64,{encoded}"
+
+_ENV_WHITESPACE = b" \t\r"
 
 
 def load_env_file(path: Path) -> None:
-    """Populate environment variables from a KEY=VALUE dotenv file."""
+    """Populate environment variables from a KEY=VALUE dotenv file.
+
+    Parses the raw bytes in a single pass with index arithmetic, so no
+    intermediate line/str objects are created until the final decode of each
+    accepted key and value.
+    """
 
     if not path.is_file():
         return
 
     try:
-        for raw_line in path.read_text(encoding="utf-8").splitlines():
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            key = key.strip()
-            if not key:
-                continue
-            value = value.strip().strip('"').strip("'")
-            os.environ.setdefault(key, value)
+        raw = path.read_bytes()
     except OSError as exc:
         print(f"Failed to read env file {path}: {exc}", file=sys.stderr)
+        return
+
+    whitespace = _ENV_WHITESPACE
+    pos = 0
+    size = len(raw)
+    while pos < size:
+        newline = raw.find(b"\n", pos)
+        end = size if newline < 0 else newline
+        start = pos
+        pos = end + 1
+
+        # Trim the line in place by moving indices instead of slicing.
+        while start < end and raw[start] in whitespace:
+            start += 1
+        while end > start and raw[end - 1] in whitespace:
+            end -= 1
+        if start == end or raw[start] == 0x23:  # empty or '#' comment
+            continue
+
+        eq = raw.find(b"=", start, end)
+        if eq < 0:
+            continue
+
+        key_end = eq
+        while key_end > start and raw[key_end - 1] in whitespace:
+            key_end -= 1
+        if key_end == start:
+            continue
+
+        value_start = eq + 1
+        while value_start < end and raw[value_start] in whitespace:
+            value_start += 1
+        if end - value_start >= 2 and raw[value_start] == raw[end - 1] and raw[value_start] in b"\"'":
+            value_start += 1
+            end -= 1
+
+        os.environ.setdefault(
+            raw[start:key_end].decode("utf-8"),
+            raw[value_start:end].decode("utf-8"),
+        )
 
 
 __all__ = [
     "SUPPORTED_IMAGE_EXTENSIONS",
     "collect_image_paths",
+    "hash_file_contents",
     "guess_mime_type",
+    "downscale_image_bytes",
     "encode_image_as_data_url",
     "load_env_file",
 ]
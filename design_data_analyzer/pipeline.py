@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ColorSwatch:
     """Represents a single detected color and its contextual metadata."""
 
@@ -17,7 +18,7 @@ class ColorSwatch:
     usage_hint: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TypographySample:
     """Lightweight description of detected typographic usage."""
 
@@ -27,7 +28,7 @@ class TypographySample:
     classification: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LayoutSummary:
     """Encapsulates coarse layout cues used to infer guideline recommendations."""
 
@@ -37,7 +38,7 @@ class LayoutSummary:
     focal_regions: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageExtraction:
     """All signals collected from a single asset."""
 
@@ -49,7 +50,7 @@ class ImageExtraction:
     notes: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedEvidence:
     """Merged signals across the full asset set."""
 
@@ -77,13 +78,13 @@ def consolidate(extractions: Iterable[ImageExtraction]) -> AggregatedEvidence:
         for color in extraction.colors:
             key = color.hex.upper()
             existing = by_hex.get(key)
-            if existing and existing.prominence >= color.prominence:
-                continue
-            by_hex[key] = color
+            if existing is None or color.prominence > existing.prominence:
+                by_hex[key] = color
         for typo in extraction.typography:
-            key = f"{typo.classification}:{typo.weight}:{typo.casing}"
-            if key not in typography_samples:
-                typography_samples[key] = typo
+            # setdefault keeps the first sample per key with one hash lookup.
+            typography_samples.setdefault(
+                f"{typo.classification}:{typo.weight}:{typo.casing}", typo
+            )
         if extraction.layout:
             layout_patterns.append(extraction.layout.dominant_orientation)
             whitespace = extraction.layout.whitespace_ratio
@@ -94,7 +95,7 @@ def consolidate(extractions: Iterable[ImageExtraction]) -> AggregatedEvidence:
         copy_lines.extend(extraction.detected_copy)
         production.extend(extraction.notes)
 
-    palette = sorted(by_hex.values(), key=lambda item: item.prominence, reverse=True)
+    palette = sorted(by_hex.values(), key=attrgetter("prominence"), reverse=True)
     return AggregatedEvidence(
         images=images,
         palette=palette,
@@ -5,6 +5,7 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import numpy as np
 from PIL import Image
 
 from design_data_analyzer.analyzer import aggregate
@@ -13,14 +14,10 @@ from design_data_analyzer.guidelines import build_document, render_markdown
 
 
 def create_test_image(path: Path) -> None:
-    image = Image.new("RGB", (120, 120), "white")
-    for y in range(120):
-        for x in range(120):
-            if y < 60:
-                image.putpixel((x, y), (0, 161, 222))
-            else:
-                image.putpixel((x, y), (200, 48, 48))
-    image.save(path)
+    arr = np.empty((120, 120, 3), dtype=np.uint8)
+    arr[:60] = (0, 161, 222)
+    arr[60:] = (200, 48, 48)
+    Image.fromarray(arr, "RGB").save(path)
 
 
 def test_guideline_generation(tmp_path):